@@ -12,21 +12,81 @@ import argparse
 import json
 import os
 import sys
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout, ConnectionError, HTTPError
+from urllib3.util.retry import Retry
+
+
+class RateLimiter:
+    """Token-bucket limiter capping outgoing requests per minute.
+
+    Keeps long config-file runs from tripping WAF rate limits on the
+    target. The bucket refills on a monotonic clock; acquire() sleeps
+    until a token is available.
+    """
+
+    def __init__(self, rate_per_minute: int):
+        self.rate = rate_per_minute
+        self.tokens = float(rate_per_minute)
+        self.last_refill = time.monotonic()
+
+    def acquire(self):
+        """Wait until a token is available, then consume it."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                float(self.rate),
+                self.tokens + (now - self.last_refill) * (self.rate / 60.0)
+            )
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            time.sleep((1 - self.tokens) * (60.0 / self.rate))
 
 
 class APITester:
     """Main API testing class."""
 
-    def __init__(self, base_url: str = None, auth_token: str = None, api_key: str = None):
+    def __init__(self, base_url: str = None, auth_token: str = None, api_key: str = None,
+                 rate_per_minute: int = None, session: requests.Session = None):
         self.base_url = base_url or os.getenv("API_BASE_URL", "")
         self.auth_token = auth_token or os.getenv("JWT_TOKEN")
         self.api_key = api_key or os.getenv("API_KEY")
-        self.session = requests.Session()
+
+        if session is not None:
+            # Injected session: share the caller's connection pool (and
+            # whatever retry policy it mounted) across test suites.
+            self.session = session
+        else:
+            self.session = requests.Session()
+
+            # Retry transient failures (connection resets, 5xx) with
+            # exponential backoff so a dropped packet doesn't fail the
+            # test. Idempotent methods only — retrying POST can create
+            # duplicate resources — and 429 is excluded so tests that
+            # expect it see the real status instead of a RetryError.
+            retry = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "HEAD"])
+            )
+            adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
         self.results = []
+        self.limiter = RateLimiter(rate_per_minute) if rate_per_minute else None
+        # test_endpoint may be called from worker threads; guard results.
+        self._results_lock = threading.Lock()
 
         # Set default headers
         if self.auth_token:
@@ -71,7 +131,13 @@ class APITester:
             req_headers.update(headers)
 
         # Prepare request
-        start_time = datetime.now()
+        if self.limiter:
+            self.limiter.acquire()
+
+        # Wall-clock timestamp for the record; monotonic perf_counter_ns
+        # for the duration so the measurement window stays allocation-free.
+        start_iso = datetime.now(timezone.utc).isoformat()
+        t0 = time.perf_counter_ns()
 
         try:
             response = self.session.request(
@@ -83,13 +149,13 @@ class APITester:
                 timeout=timeout
             )
 
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds() * 1000  # ms
+            duration = (time.perf_counter_ns() - t0) / 1e6  # ms
 
-            # Parse response
+            # Parse response once from the raw bytes; orjson skips the
+            # Python-level UTF-8 re-decode that response.json() pays.
             try:
-                response_body = response.json()
-            except:
+                response_body = orjson.loads(response.content)
+            except ValueError:
                 response_body = response.text
 
             result = {
@@ -100,7 +166,7 @@ class APITester:
                 "duration_ms": round(duration, 2),
                 "headers": dict(response.headers),
                 "body": response_body,
-                "timestamp": start_time.isoformat()
+                "timestamp": start_iso
             }
 
             # Check expected status
@@ -114,7 +180,7 @@ class APITester:
                 if "error" not in result:
                     result["error"] = f"Non-success status code: {response.status_code}"
 
-            self.results.append(result)
+            self._record(result)
             return result
 
         except Timeout:
@@ -123,9 +189,9 @@ class APITester:
                 "url": full_url,
                 "method": method.upper(),
                 "error": "Request timeout",
-                "timestamp": start_time.isoformat()
+                "timestamp": start_iso
             }
-            self.results.append(result)
+            self._record(result)
             return result
 
         except ConnectionError:
@@ -134,22 +200,27 @@ class APITester:
                 "url": full_url,
                 "method": method.upper(),
                 "error": "Connection error",
-                "timestamp": start_time.isoformat()
+                "timestamp": start_iso
             }
-            self.results.append(result)
+            self._record(result)
             return result
 
-        except Exception as e:
+        except requests.RequestException as e:
             result = {
                 "success": False,
                 "url": full_url,
                 "method": method.upper(),
                 "error": str(e),
-                "timestamp": start_time.isoformat()
+                "timestamp": start_iso
             }
-            self.results.append(result)
+            self._record(result)
             return result
 
+    def _record(self, result: Dict[str, Any]):
+        """Append a result under the lock (safe from worker threads)."""
+        with self._results_lock:
+            self.results.append(result)
+
     def print_result(self, result: Dict[str, Any]):
         """Print test result in a readable format."""
         success_icon = "✓" if result.get("success") else "✗"
@@ -168,14 +239,17 @@ class APITester:
         if result.get("body"):
             body = result["body"]
             if isinstance(body, dict) or isinstance(body, list):
-                print(f"  Response: {json.dumps(body, indent=2)[:500]}...")
+                preview = orjson.dumps(body, option=orjson.OPT_INDENT_2)[:500]
+                print(f"  Response: {preview.decode('utf-8', errors='replace')}...")
             else:
                 print(f"  Response: {str(body)[:500]}...")
 
     def save_results(self, filename: str = "test_results.json"):
         """Save test results to a JSON file."""
-        with open(filename, "w") as f:
-            json.dump(self.results, f, indent=2)
+        # orjson encodes straight to UTF-8 bytes, skipping the str->bytes
+        # copy stdlib json pays, and is much faster on large result sets.
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
 
         print(f"\n✓ Results saved to {filename}")
 
@@ -207,6 +281,10 @@ def main():
     parser.add_argument("--token", help="Bearer token for authentication")
     parser.add_argument("--api-key", help="API key for authentication")
     parser.add_argument("--expected-status", type=int, help="Expected HTTP status code")
+    parser.add_argument("--rate-per-minute", type=int,
+                        help="Cap outgoing requests per minute (avoids WAF bans)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Worker threads for config-file test runs (default: 8)")
 
     # Config file mode
     parser.add_argument("--config", help="Path to configuration JSON file")
@@ -218,7 +296,11 @@ def main():
     args = parser.parse_args()
 
     # Initialize tester
-    tester = APITester(auth_token=args.token, api_key=args.api_key)
+    tester = APITester(
+        auth_token=args.token,
+        api_key=args.api_key,
+        rate_per_minute=args.rate_per_minute
+    )
 
     # Config file mode
     if args.config:
@@ -232,18 +314,28 @@ def main():
 
         print(f"Running {len(tests)} tests from config file...\n")
 
-        for test in tests:
-            result = tester.test_endpoint(
-                url=test.get("url"),
-                method=test.get("method", "GET"),
-                headers=test.get("headers"),
-                data=test.get("data"),
-                params=test.get("params"),
-                expected_status=test.get("expected_status")
-            )
-
-            if args.verbose:
-                tester.print_result(result)
+        # requests releases the GIL around socket I/O, so a thread pool
+        # turns N serial round-trips into roughly max(RTT) wall time.
+        max_workers = min(args.concurrency, len(tests)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    tester.test_endpoint,
+                    url=test.get("url"),
+                    method=test.get("method", "GET"),
+                    headers=test.get("headers"),
+                    data=test.get("data"),
+                    params=test.get("params"),
+                    expected_status=test.get("expected_status")
+                )
+                for test in tests
+            ]
+
+            for future in as_completed(futures):
+                result = future.result()
+
+                if args.verbose:
+                    tester.print_result(result)
 
     # Single test mode
     elif args.url:
@@ -1,18 +1,39 @@
 import requests
 import json
-from datetime import datetime
+import sys
+import time
+from datetime import datetime, timezone
 from typing import Dict, Any
 
+# Shared session so repeated calls reuse pooled connections instead of
+# paying a fresh TCP+TLS handshake per request. Transient failures
+# (connection resets, 5xx) retry with exponential backoff — idempotent
+# methods only, and no 429 so a rate-limited response is reported as-is.
+_default_session = requests.Session()
+_retry = requests.adapters.Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "HEAD"])
+)
+_adapter = requests.adapters.HTTPAdapter(max_retries=_retry)
+_default_session.mount("https://", _adapter)
+_default_session.mount("http://", _adapter)
+
 def test_api_endpoint(
     url: str,
     method: str = "GET",
     headers: Dict[str, str] = None,
     data: Any = None,
-    auth_token: str = None
+    auth_token: str = None,
+    session: requests.Session = None
 ) -> Dict[str, Any]:
     """
     Test an API endpoint with validation.
 
+    An existing requests.Session can be injected via `session`;
+    otherwise the module-level pooled session is used.
+
     Returns dict with status, response, and validation results.
     """
     # Prepare headers
@@ -20,17 +41,22 @@ def test_api_endpoint(
     if auth_token:
         req_headers["Authorization"] = f"Bearer {auth_token}"
 
+    http = session or _default_session
+
     # Send request
     try:
-        start_time = datetime.now()
-        response = requests.request(
+        # Wall-clock timestamp for the record; monotonic perf_counter_ns
+        # for the measured duration.
+        start_iso = datetime.now(timezone.utc).isoformat()
+        t0 = time.perf_counter_ns()
+        response = http.request(
             method=method.upper(),
             url=url,
             headers=req_headers,
             json=data if data else None,
             timeout=30
         )
-        end_time = datetime.now()
+        elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
 
         # Validate response
         result = {
@@ -38,8 +64,8 @@ def test_api_endpoint(
             "status_code": response.status_code,
             "headers": dict(response.headers),
             "body": response.json() if response.headers.get("Content-Type", "").startswith("application/json") else response.text,
-            "time_ms": (end_time - start_time).total_seconds() * 1000,
-            "timestamp": start_time.isoformat()
+            "time_ms": elapsed_ms,
+            "timestamp": start_iso
         }
 
         return result
@@ -48,7 +74,7 @@ def test_api_endpoint(
         return {"success": False, "error": "Request timeout"}
     except requests.exceptions.ConnectionError:
         return {"success": False, "error": "Connection error"}
-    except Exception as e:
+    except (requests.RequestException, ValueError) as e:
         return {"success": False, "error": str(e)}
 
 def validate_product_response(response_body: Dict[str, Any]) -> Dict[str, Any]:
@@ -80,44 +106,46 @@ def validate_product_response(response_body: Dict[str, Any]) -> Dict[str, Any]:
 
     return validation_results
 
-def generate_report(result: Dict[str, Any], validation: Dict[str, Any]) -> str:
+def write_report(result: Dict[str, Any], validation: Dict[str, Any], fp) -> None:
     """
-    Generate a detailed test report.
+    Write a detailed test report to an open file object.
+
+    Streaming straight to the handle avoids building the whole report
+    (including the formatted response body) in memory first.
     """
-    report = []
-    report.append("=" * 60)
-    report.append("API TEST REPORT")
-    report.append("=" * 60)
-    report.append(f"\nTimestamp: {result.get('timestamp', 'N/A')}")
-    report.append(f"URL: https://dummyjson.com/products/1")
-    report.append(f"Method: GET")
-    report.append(f"\n--- RESPONSE ---")
-    report.append(f"Status Code: {result.get('status_code', 'N/A')}")
-    report.append(f"Success: {result.get('success', False)}")
-    report.append(f"Response Time: {result.get('time_ms', 0):.2f} ms")
+    fp.write("=" * 60 + "\n")
+    fp.write("API TEST REPORT\n")
+    fp.write("=" * 60 + "\n")
+    fp.write(f"\nTimestamp: {result.get('timestamp', 'N/A')}\n")
+    fp.write("URL: https://dummyjson.com/products/1\n")
+    fp.write("Method: GET\n")
+    fp.write("\n--- RESPONSE ---\n")
+    fp.write(f"Status Code: {result.get('status_code', 'N/A')}\n")
+    fp.write(f"Success: {result.get('success', False)}\n")
+    fp.write(f"Response Time: {result.get('time_ms', 0):.2f} ms\n")
 
     if result.get('success'):
-        report.append(f"\n--- RESPONSE BODY ---")
-        report.append(json.dumps(result.get('body', {}), indent=2))
+        fp.write("\n--- RESPONSE BODY ---\n")
+        fp.write(json.dumps(result.get('body', {}), indent=2))
+        fp.write("\n")
 
-        report.append(f"\n--- VALIDATION RESULTS ---")
+        fp.write("\n--- VALIDATION RESULTS ---\n")
         if validation['valid']:
-            report.append("[PASS] Response structure is valid")
+            fp.write("[PASS] Response structure is valid\n")
         else:
-            report.append("[FAIL] Response validation failed")
+            fp.write("[FAIL] Response validation failed\n")
             for error in validation['errors']:
-                report.append(f"  - {error}")
+                fp.write(f"  - {error}\n")
 
         if validation['warnings']:
-            report.append("\nWarnings:")
+            fp.write("\nWarnings:\n")
             for warning in validation['warnings']:
-                report.append(f"  - {warning}")
+                fp.write(f"  - {warning}\n")
     else:
-        report.append(f"\n--- ERROR ---")
-        report.append(f"Error: {result.get('error', 'Unknown error')}")
+        fp.write("\n--- ERROR ---\n")
+        fp.write(f"Error: {result.get('error', 'Unknown error')}\n")
 
-    report.append("\n" + "=" * 60)
-    return "\n".join(report)
+    fp.write("\n" + "=" * 60 + "\n")
 
 if __name__ == "__main__":
     # Test the DummyJSON products API
@@ -134,12 +162,10 @@ if __name__ == "__main__":
     if result.get('success') and isinstance(result.get('body'), dict):
         validation = validate_product_response(result['body'])
 
-    # Generate and print report
-    report = generate_report(result, validation)
-    print(report)
+    # Print report and save it to file
+    write_report(result, validation, sys.stdout)
 
-    # Save report to file
     with open("api_test_report.txt", "w", encoding="utf-8") as f:
-        f.write(report)
+        write_report(result, validation, f)
 
     print("\n[SUCCESS] Report saved to: api_test_report.txt")